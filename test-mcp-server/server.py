@@ -1,59 +1,83 @@
 from fastmcp import FastMCP
 import logging
+import os
+import time
 
-# Set up detailed logging
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the strftime() text for records logged within the same second."""
+
+    _cached_second = None
+    _cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = time.strftime(self.default_time_format, self.converter(record.created))
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+# Set up logging: one INFO record per tool call (level from LOG_LEVEL, a name like
+# "debug" or a number; defaults to INFO)
+_log_level_setting = (os.environ.get("LOG_LEVEL") or "").strip() or "INFO"
+if _log_level_setting.isdigit():
+    _log_level = int(_log_level_setting)
+else:
+    _log_level = logging.getLevelName(_log_level_setting.upper())
+
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(_CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=_log_level if isinstance(_log_level, int) else logging.INFO,
+    handlers=[_log_handler]
 )
 logger = logging.getLogger("mcp-server")
 
+if not isinstance(_log_level, int):
+    logger.warning("Unknown LOG_LEVEL %r, falling back to INFO", _log_level_setting)
+
 # Initialize the MCP server
 mcp = FastMCP("Demo Python Server")
 
 @mcp.tool()
 def add(a: int, b: int) -> int:
     """Add two numbers"""
-    logger.info(f"=== TOOL CALLED: add ===")
-    logger.info(f"Parameters: a={a}, b={b}")
     result = a + b
-    logger.info(f"Result: {result}")
-    print(f"\n*** ADD TOOL EXECUTED: {a} + {b} = {result} ***\n")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("add a=%s b=%s -> %s", a, b, result)
     return result
 
 @mcp.tool()
 def divide(x: int, y: int) -> int:
     """Divide x by y"""
-    logger.info(f"=== TOOL CALLED: divide ===")
-    logger.info(f"Parameters: x={x}, y={y}")
     result = x / y
-    logger.info(f"Result: {result}")
-    print(f"\n*** DIVIDE TOOL EXECUTED: '{x} / {y} = {result}' ***\n")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("divide x=%s y=%s -> %s", x, y, result)
     return result
 
     
 @mcp.tool()
 def echo(message: str) -> str:
     """Echo a message back"""
-    logger.info(f"=== TOOL CALLED: echo ===")
-    logger.info(f"Parameters: message={message}")
     result = f"Echo: {message}"
-    logger.info(f"Result: {result}")
-    print(f"\n*** ECHO TOOL EXECUTED: '{message}' ***\n")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("echo message=%r -> %r", message, result)
     return result
 
 @mcp.resource("greeting://{name}")
 def get_greeting(name: str) -> str:
     """Get a personalized greeting"""
-    logger.info(f"=== RESOURCE CALLED: greeting ===")
-    logger.info(f"Parameters: name={name}")
-    return f"Hello, {name}!"
+    result = f"Hello, {name}!"
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("greeting name=%r -> %r", name, result)
+    return result
 
 if __name__ == "__main__":
     # Run the server using streamable HTTP transport for simpler JSON-RPC handling
     # This exposes /mcp endpoint for POST requests
     print("=" * 60)
     print("Starting MCP server on http://localhost:8000/mcp")
-    print("Available tools: add(a, b), echo(message)")
+    print("Available tools: add(a, b), divide(x, y), echo(message)")
     print("=" * 60)
     mcp.run(transport="streamable-http", host="127.0.0.1", port=8000)
\ No newline at end of file